@@ -4,31 +4,108 @@ A Flask application that exports UptimeRobot monitor metrics in Prometheus forma
 """
 
 import argparse
+import calendar
+import functools
+import gzip
+import hashlib
 import logging
+import math
 import os
+import re
+import threading
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from configparser import ConfigParser
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Union
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 import requests
-from flask import Flask, Response
-from prometheus_client import CollectorRegistry, core, generate_latest
+from flask import Flask, Response, request
+from prometheus_client import CollectorRegistry, core
 from prometheus_client.metrics_core import Metric
 from prometheus_client.registry import Collector
+from prometheus_client.utils import floatToGoString
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from werkzeug.datastructures import Headers
+from werkzeug.exceptions import HTTPException
+
+# C JSON parser, 2-5x faster on monitor payloads; install the `orjson`
+# extra to get it, the stdlib parser is the fallback
+_json_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    _json_loads = json.loads
 
 # Constants
 API_BASE_URL = "https://api.uptimerobot.com/v3"
 DEFAULT_HOST = os.environ.get("UPTIMEROBOT_HOST", "127.0.0.1")
 DEFAULT_PORT = 9429
+DEFAULT_CACHE_TTL = 15.0
+DEFAULT_STALE_TTL = 300.0
 LOG_FORMAT = "%(asctime)s %(levelname)-5.5s [%(name)s] %(message)s"
 NAMESPACE = "uptimerobot"
 MIMETYPE_TEXT_PLAIN = "text/plain"
+_API_KEY_ENV = "UPTIMEROBOT_API_KEY"
+MAX_PARALLEL_PAGE_FETCHES = 4
+SERVER_THREADS = 8
+# Sharded processing only pays off for large accounts; below the
+# threshold the serial loop is faster than spinning up a pool
+PARALLEL_PROCESS_THRESHOLD = 200
+PROCESS_CHUNK_SIZE = 128
+MAX_PARALLEL_PROCESS_WORKERS = 4
+
+# Extracts all label fields of a monitor in one C-level call
+_MONITOR_LABEL_FIELDS = itemgetter("friendlyName", "type", "url")
+
+# API status -> (gauge value, monitor_paused label); one lookup replaces
+# the per-monitor string comparisons and ternaries
+_STATUS_MAP: Dict[str, tuple] = {
+    "UP": (1, "false"),
+    "DOWN": (0, "false"),
+    "PAUSED": (0, "true"),
+    "SEEMS_DOWN": (0, "false"),
+    "NOT_CHECKED_YET": (0, "false"),
+}
+_STATUS_DEFAULT = (0, "false")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so paginated scrapes reuse one TCP+TLS connection
+# instead of paying a fresh handshake per page.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        # Exponential backoff with full jitter on transient failures;
+        # 4xx auth/client errors are not in the forcelist and fail fast
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=0.2,
+            backoff_jitter=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
 
 class UptimeRobotAPIError(Exception):
     """Exception raised for UptimeRobot API errors."""
@@ -36,6 +113,123 @@ class UptimeRobotAPIError(Exception):
     pass
 
 
+class _CircuitBreaker:
+    """Minimal circuit breaker for upstream API calls.
+
+    After ``failure_threshold`` consecutive failures the breaker opens
+    and callers fail fast for ``recovery_seconds`` without touching the
+    network; the first call after the cooldown is let through as a
+    trial and closes or re-opens the breaker based on its outcome.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_seconds: float = 30.0
+    ) -> None:
+        """Initialize the breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            recovery_seconds: Cooldown before a trial call is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._lock = threading.Lock()
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+
+    def check(self) -> None:
+        """Fail fast while the breaker is open.
+
+        Raises:
+            UptimeRobotAPIError: If the breaker is open and the cooldown
+                has not yet elapsed
+        """
+        with self._lock:
+            if (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.recovery_seconds
+            ):
+                raise UptimeRobotAPIError(
+                    "circuit open: upstream API failing, retry later"
+                )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._failure_count = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failure_count += 1
+            if self._failure_count >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(iso_string: str) -> Optional[float]:
+    """Convert an ISO datetime string to a Unix timestamp, memoized.
+
+    SSL expiry dates cluster heavily (shared certificates, common
+    renewal dates) and are stable between scrapes, so repeated strings
+    become a cache hit.
+
+    Args:
+        iso_string: ISO 8601 formatted datetime string
+
+    Returns:
+        Unix timestamp or None if parsing fails
+    """
+    # Cheap shape check first: rejecting junk here avoids the
+    # exception-driven slow path in fromisoformat entirely
+    if len(iso_string) < 20 or iso_string[4] != "-":
+        logger.error(f"Failed to parse datetime '{iso_string}': not ISO 8601")
+        return None
+
+    # Fast path for the fixed layout the API emits
+    # (2025-11-28T21:31:54.000Z): slice the fields and feed
+    # calendar.timegm directly, skipping datetime allocation and the
+    # intermediate string the "+00:00" rewrite below would create.
+    if (
+        len(iso_string) == 24
+        and iso_string[10] == "T"
+        and iso_string[19] == "."
+        and iso_string[23] == "Z"
+    ):
+        try:
+            year = int(iso_string[0:4])
+            month = int(iso_string[5:7])
+            day = int(iso_string[8:10])
+            hour = int(iso_string[11:13])
+            minute = int(iso_string[14:16])
+            second = int(iso_string[17:19])
+            millis = int(iso_string[20:23])
+            # timegm does not validate, so out-of-range fields must be
+            # sent to the strict parser below
+            if (
+                1 <= month <= 12
+                and 1 <= day <= calendar.monthrange(year, month)[1]
+                and hour <= 23
+                and minute <= 59
+                and second <= 59
+            ):
+                return (
+                    calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+                    + millis / 1000.0
+                )
+        except ValueError:
+            pass  # Non-numeric fields; fall through to the general parser
+
+    try:
+        # Parse ISO 8601 format: 2025-11-28T21:31:54.000Z
+        dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
+        return dt.timestamp()
+    except (ValueError, AttributeError) as e:
+        logger.error(f"Failed to parse datetime '{iso_string}': {e}")
+        return None
+
+
 class PrometheusGauge(core.GaugeMetricFamily):
     """Custom Gauge metric family with namespace support."""
 
@@ -70,6 +264,14 @@ class PrometheusGauge(core.GaugeMetricFamily):
         """Create a clone of this gauge."""
         return type(self)(self._name, self.documentation, self._namespace)
 
+    def reset_samples(self) -> None:
+        """Drop all samples, keeping name and documentation intact.
+
+        Cheaper than cloning a fresh gauge per scrape when the instance
+        is reused.
+        """
+        self.samples.clear()
+
 
 class UptimeRobotCollector(Collector):
     """Prometheus collector for UptimeRobot metrics."""
@@ -78,12 +280,14 @@ class UptimeRobotCollector(Collector):
     STATUS_DOWN = "DOWN"
     STATUS_PAUSED = "PAUSED"
 
-    def __init__(self, api_key: str, timeout: int = 30) -> None:
+    def __init__(self, api_key: str, timeout: int = 30, cache_ttl: float = 0.0) -> None:
         """Initialize the collector.
 
         Args:
             api_key: UptimeRobot API key
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to reuse fetched monitors before hitting
+                the API again; 0 disables caching
 
         Raises:
             ValueError: If API key is empty
@@ -98,6 +302,28 @@ class UptimeRobotCollector(Collector):
 
         self.api_key = api_key
         self.timeout = timeout
+        # Request headers never change for a collector; build them once
+        # and hand the same immutable mapping to every page fetch
+        self._headers = MappingProxyType(
+            {
+                "accept": "application/json",
+                "authorization": f"Bearer {api_key}",
+            }
+        )
+        # Fail fast during upstream outages instead of burning the full
+        # timeout budget on every scrape
+        self._breaker = _CircuitBreaker()
+        # Serializes collect() so scrapes never reset shared gauges
+        # while another scrape is filling them
+        self._collect_lock = threading.Lock()
+        # Single-flight state: concurrent scrapes share one upstream fetch
+        self._inflight_lock = threading.Lock()
+        self._inflight: Optional["Future[List[Dict[str, Any]]]"] = None
+        # Monitor cache: multiple Prometheus replicas scraping within
+        # the TTL share one upstream fetch
+        self.cache_ttl = cache_ttl
+        self._cache_data: Optional[List[Dict[str, Any]]] = None
+        self._cache_ts = 0.0
         # Cache metrics to ensure consistency
         self._metrics = {
             "up": PrometheusGauge("up", "Is the monitor up?"),
@@ -112,6 +338,9 @@ class UptimeRobotCollector(Collector):
     def _parse_iso_datetime(iso_string: str) -> Optional[float]:
         """Convert ISO datetime string to Unix timestamp.
 
+        Thin wrapper around the module-level memoized parser, kept for
+        API compatibility.
+
         Args:
             iso_string: ISO 8601 formatted datetime string
 
@@ -120,14 +349,7 @@ class UptimeRobotCollector(Collector):
         """
         if not iso_string:
             return None
-
-        try:
-            # Parse ISO 8601 format: 2025-11-28T21:31:54.000Z
-            dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-            return dt.timestamp()
-        except (ValueError, AttributeError) as e:
-            logger.error(f"Failed to parse datetime '{iso_string}': {e}")
-            return None
+        return _parse_iso_timestamp(iso_string)
 
     @classmethod
     def configure(cls, api_key: str, timeout: int = 30) -> "UptimeRobotCollector":
@@ -159,27 +381,37 @@ class UptimeRobotCollector(Collector):
         Returns:
             List of configured PrometheusGauge instances.
         """
-        start_time = datetime.now()
-        try:
-            # Get fresh metrics dictionary
-            metrics = self.metrics
-
-            # Fetch monitors and update metrics
-            monitors = self._get_monitors()
-            for monitor in monitors:
-                self._process_monitor(monitor, metrics)
-
-            # Record scrape duration
-            duration = (datetime.now() - start_time).total_seconds()
-            metrics["scrape_duration_seconds"](duration, {})
-
-        except UptimeRobotAPIError:
-            # Re-raise API errors to be handled by the web app
-            raise
-        except Exception as e:
-            logger.error(f"Error collecting metrics: {e}")
-
-        return list(self.metrics.values())
+        # Serialize scrapes: the gauges are shared instance state, so a
+        # concurrent collect must not reset them mid-fill.
+        with self._collect_lock:
+            values = list(self._metrics.values())
+            # The gauges are cached on the instance, so drop the previous
+            # scrape's samples before filling them again; otherwise they
+            # would accumulate without bound.
+            for gauge in values:
+                gauge.reset_samples()
+
+            # Integer nanosecond clock: two calls bracket the scrape and
+            # the float division happens once at the end
+            start_time = time.perf_counter_ns()
+            try:
+                metrics = self._metrics
+
+                # Fetch monitors and update metrics
+                monitors = self._get_monitors()
+                self._process_monitors(monitors, metrics)
+
+                # Record scrape duration
+                duration = (time.perf_counter_ns() - start_time) / 1e9
+                metrics["scrape_duration_seconds"](duration, {})
+
+            except UptimeRobotAPIError:
+                # Re-raise API errors to be handled by the web app
+                raise
+            except Exception as e:
+                logger.error(f"Error collecting metrics: {e}")
+
+            return values
 
     def _process_monitor(
         self, monitor: Dict[str, Any], metrics: Dict[str, PrometheusGauge]
@@ -190,36 +422,168 @@ class UptimeRobotCollector(Collector):
             monitor: Monitor data from API
             metrics: Dictionary of metric collectors
         """
-        try:
-            status = monitor.get("status")
-            labels = {
-                "monitor_name": monitor.get("friendlyName", ""),
-                "monitor_type": monitor.get("type", ""),
-                "monitor_url": monitor.get("url", ""),
-                "monitor_paused": "true" if status == self.STATUS_PAUSED else "false",
-            }
+        self._process_monitors([monitor], metrics)
 
-            # Set monitor up/down status
-            is_up = status == self.STATUS_UP
-            metrics["up"](1 if is_up else 0, labels)
+    def _process_monitors(
+        self, monitors: List[Dict[str, Any]], metrics: Dict[str, PrometheusGauge]
+    ) -> None:
+        """Process monitors in one pass and update metrics.
 
-            # Set numeric status
-            status_value = 1 if is_up else 0
-            metrics["status"](status_value, labels)
+        The per-monitor work is kept deliberately flat: gauges, sample
+        names and helpers are hoisted out of the loop and one labels dict
+        is shared by all samples of a monitor, so large accounts do not
+        pay repeated lookups per monitor.
 
-            # Handle SSL expiry date
-            ssl_info = monitor.get("sslExpiryDateTime")
-            if ssl_info:
-                ssl_timestamp = self._parse_iso_datetime(ssl_info)
-                if ssl_timestamp is not None:
-                    metrics["ssl_expire"](ssl_timestamp, labels)
+        Args:
+            monitors: Monitor data list from API
+            metrics: Dictionary of metric collectors
+        """
+        if len(monitors) >= PARALLEL_PROCESS_THRESHOLD:
+            self._process_monitors_sharded(monitors, metrics)
+            return
 
+        try:
+            up_gauge = metrics["up"]
+            status_gauge = metrics["status"]
+            ssl_gauge = metrics["ssl_expire"]
         except Exception as e:
-            logger.error(
-                f"Error processing monitor {monitor.get('friendlyName', 'unknown')}: {e}"
-            )
+            logger.error(f"Error processing monitors: {e}")
+            return
+
+        up_samples = up_gauge.samples.append
+        status_samples = status_gauge.samples.append
+        ssl_samples = ssl_gauge.samples.append
+        up_name = up_gauge.name
+        status_name = status_gauge.name
+        ssl_name = ssl_gauge.name
+        sample = core.Sample
+        parse_datetime = _parse_iso_timestamp
+        status_table = _STATUS_MAP
+        status_default = _STATUS_DEFAULT
+        label_fields = _MONITOR_LABEL_FIELDS
+
+        for monitor in monitors:
+            try:
+                try:
+                    # Missing, unknown and unhashable statuses all fall
+                    # back to down/not-paused
+                    status_value, paused = status_table[monitor["status"]]
+                except (KeyError, TypeError):
+                    status_value, paused = status_default
+
+                try:
+                    # Fast path: one itemgetter call extracts all label
+                    # fields present on well-formed monitors
+                    name, monitor_type, url = label_fields(monitor)
+                except KeyError:
+                    # Malformed monitor: coerce whatever is there into
+                    # label-safe strings
+                    name = str(monitor.get("friendlyName") or "")
+                    monitor_type = str(monitor.get("type") or "")
+                    url = str(monitor.get("url") or "")
+
+                labels = {
+                    "monitor_name": name,
+                    "monitor_type": monitor_type,
+                    "monitor_url": url,
+                    "monitor_paused": paused,
+                }
+
+                # Up/down and numeric status share the same value
+                up_samples(sample(up_name, labels, status_value))
+                status_samples(sample(status_name, labels, status_value))
+
+                # Handle SSL expiry date
+                ssl_info = monitor.get("sslExpiryDateTime")
+                if ssl_info:
+                    ssl_timestamp = parse_datetime(ssl_info)
+                    if ssl_timestamp is not None:
+                        ssl_samples(sample(ssl_name, labels, ssl_timestamp))
+
+            except Exception as e:
+                logger.error(
+                    f"Error processing monitor {monitor.get('friendlyName', 'unknown')}: {e}"
+                )
+
+    def _process_monitors_sharded(
+        self, monitors: List[Dict[str, Any]], metrics: Dict[str, PrometheusGauge]
+    ) -> None:
+        """Process a large monitor list across a thread pool.
+
+        Each chunk writes into its own cloned gauges (shared-nothing),
+        and the samples are merged back in order afterwards, so the hot
+        loop itself stays lock-free.
+
+        Args:
+            monitors: Monitor data list from API
+            metrics: Dictionary of metric collectors
+        """
+        chunks = []
+        for start in range(0, len(monitors), PROCESS_CHUNK_SIZE):
+            stop = start + PROCESS_CHUNK_SIZE
+            chunks.append(monitors[start:stop])
+        shard_metrics = [
+            {key: gauge.clone() for key, gauge in metrics.items()} for _ in chunks
+        ]
+
+        workers = min(MAX_PARALLEL_PROCESS_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the iterator so worker errors surface here
+            list(executor.map(self._process_monitors, chunks, shard_metrics))
+
+        for shard in shard_metrics:
+            for key, gauge in metrics.items():
+                gauge.samples.extend(shard[key].samples)
 
     def _get_monitors(self) -> List[Dict[str, Any]]:
+        """Fetch all monitors, de-duplicating concurrent fetches.
+
+        Only one upstream fetch runs at a time; callers arriving while a
+        fetch is in flight wait for its result (including its exception)
+        instead of firing their own round of API calls. With a positive
+        cache_ttl, fetch results are additionally reused for that many
+        seconds.
+
+        Returns:
+            List of monitor data dictionaries
+
+        Raises:
+            UptimeRobotAPIError: If API request fails
+        """
+        if (
+            self.cache_ttl > 0
+            and self._cache_data is not None
+            and time.monotonic() - self._cache_ts < self.cache_ttl
+        ):
+            return self._cache_data
+
+        with self._inflight_lock:
+            future = self._inflight
+            if future is not None:
+                owner = False
+            else:
+                future = Future()
+                self._inflight = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            monitors = self._fetch_monitors()
+            if self.cache_ttl > 0:
+                self._cache_data = monitors
+                self._cache_ts = time.monotonic()
+            future.set_result(monitors)
+            return monitors
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight = None
+
+    def _fetch_monitors(self) -> List[Dict[str, Any]]:
         """Fetch all monitors from UptimeRobot API with pagination.
 
         Returns:
@@ -233,21 +597,66 @@ class UptimeRobotCollector(Collector):
         if response:
             monitors.extend(response.get("data", []))
 
-            page_count = 0
-            while "nextLink" in response and response.get("nextLink"):
-                response = self._get_paginated(response["nextLink"])
-                if response:
-                    monitors.extend(response.get("data", []))
-                    page_count += 1
-                    logger.info(
-                        f"Fetched page {page_count} with {len(response.get('data', []))} monitors"
-                    )
-                else:
-                    break
+            page_urls = self._remaining_page_urls(response)
+            if page_urls:
+                # The first page told us how many pages exist, so fetch the
+                # rest concurrently instead of waiting one round-trip each.
+                workers = min(MAX_PARALLEL_PAGE_FETCHES, len(page_urls))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for page in executor.map(self._get_paginated, page_urls):
+                        if page:
+                            monitors.extend(page.get("data", []))
+            else:
+                page_count = 0
+                while "nextLink" in response and response.get("nextLink"):
+                    response = self._get_paginated(response["nextLink"])
+                    if response:
+                        monitors.extend(response.get("data", []))
+                        page_count += 1
+                        logger.info(
+                            f"Fetched page {page_count} with {len(response.get('data', []))} monitors"
+                        )
+                    else:
+                        break
 
         logger.info(f"Fetched {len(monitors)} total monitors")
         return monitors
 
+    @staticmethod
+    def _remaining_page_urls(response: Dict[str, Any]) -> List[str]:
+        """Derive the URLs of pages 2..N from the first page response.
+
+        Only possible when the response reports a total monitor count and
+        the next link uses page-number pagination; otherwise an empty list
+        is returned and the caller falls back to the sequential nextLink
+        walk.
+
+        Args:
+            response: First page of the monitors API response
+
+        Returns:
+            List of page URLs that can be fetched concurrently
+        """
+        next_link = response.get("nextLink")
+        total = response.get("total")
+        page_size = len(response.get("data", []))
+        if not next_link or not total or not page_size:
+            return []
+
+        parsed = urlsplit(next_link)
+        query = parse_qs(parsed.query)
+        if query.get("page") != ["2"]:
+            return []
+
+        page_count = math.ceil(total / page_size)
+        urls = []
+        for page in range(2, page_count + 1):
+            # Substitute only the page number so any other query
+            # parameters (e.g. limit) survive the rewrite
+            query["page"] = [str(page)]
+            urls.append(parsed._replace(query=urlencode(query, doseq=True)).geturl())
+        return urls
+
     def _get_paginated(
         self, next_link: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
@@ -263,35 +672,254 @@ class UptimeRobotCollector(Collector):
             UptimeRobotAPIError: If API request fails
         """
         url = next_link if next_link else f"{API_BASE_URL}/monitors/"
-        headers = {
-            "accept": "application/json",
-            "authorization": f"Bearer {self.api_key}",
-        }
+        self._breaker.check()
 
         try:
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = _SESSION.get(url, headers=self._headers, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            # Parse the raw bytes directly; orjson skips the intermediate
+            # str decode that response.json() would do.
+            data = _json_loads(response.content)
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
+            self._breaker.record_failure()
             logger.error(f"Failed to fetch monitors from {url}: {e}")
             raise UptimeRobotAPIError(f"API request failed: {e}") from e
 
+        self._breaker.record_success()
+        return data
+
+
+# Prometheus text-format type names differ from OpenMetrics for a few types
+_EXPOSITION_TYPES = {
+    "info": "gauge",
+    "stateset": "gauge",
+    "gaugehistogram": "histogram",
+    "unknown": "untyped",
+}
+
+
+# One-pass escaping beats three chained str.replace scans
+_LABEL_ESCAPE_TABLE = str.maketrans({"\\": r"\\", '"': r"\"", "\n": r"\n"})
+
+
+def _escape_label_value(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).translate(_LABEL_ESCAPE_TABLE)
 
-def create_app(api_key: Optional[str] = None) -> Flask:
+
+def _format_family(
+    metric: Metric, labelstr_cache: Optional[Dict[int, str]] = None
+) -> bytes:
+    """Render one metric family in the Prometheus text format.
+
+    Mirrors prometheus_client's text exposition (sorted labels, Go float
+    formatting) for the metric types this exporter can encounter.
+
+    Args:
+        metric: Metric family with populated samples
+        labelstr_cache: Optional memo of rendered label strings keyed by
+            labels-dict identity. The collector shares one labels dict
+            across a monitor's up/status/ssl samples, so memoizing cuts
+            label formatting to once per monitor instead of once per
+            sample. Only valid while the sample dicts stay alive.
+
+    Returns:
+        UTF-8 encoded exposition block for the family
+    """
+    name = metric.name + "_total" if metric.type == "counter" else metric.name
+    mtype = _EXPOSITION_TYPES.get(metric.type, metric.type)
+    documentation = metric.documentation.replace("\\", r"\\").replace("\n", r"\n")
+
+    if labelstr_cache is None:
+        labelstr_cache = {}
+
+    output = [f"# HELP {name} {documentation}\n", f"# TYPE {name} {mtype}\n"]
+    for sample in metric.samples:
+        labels = sample.labels
+        if labels:
+            labelstr = labelstr_cache.get(id(labels))
+            if labelstr is None:
+                labelstr = "{{{0}}}".format(
+                    ",".join(
+                        f'{key}="{_escape_label_value(value)}"'
+                        for key, value in sorted(labels.items())
+                    )
+                )
+                labelstr_cache[id(labels)] = labelstr
+        else:
+            labelstr = ""
+        timestamp = ""
+        if sample.timestamp is not None:
+            timestamp = f" {int(float(sample.timestamp) * 1000):d}"
+        output.append(
+            f"{sample.name}{labelstr} {floatToGoString(sample.value)}{timestamp}\n"
+        )
+    return "".join(output).encode("utf-8")
+
+
+def _iter_exposition(families: Iterable[Metric]) -> Iterable[bytes]:
+    """Yield the text exposition family by family.
+
+    Streaming one family at a time keeps peak memory at O(one family)
+    instead of materializing the whole body.
+
+    Args:
+        families: Collected metric families
+
+    Yields:
+        UTF-8 encoded exposition blocks
+    """
+    # Shared across families so a labels dict reused by several gauges
+    # is only rendered once.
+    labelstr_cache: Dict[int, str] = {}
+    for metric in families:
+        yield _format_family(metric, labelstr_cache)
+
+
+def _make_etag(body: bytes) -> str:
+    """Compute a short ETag for a metrics response body.
+
+    Args:
+        body: The rendered exposition body
+
+    Returns:
+        ETag value (unquoted) for the ETag header
+    """
+    return hashlib.blake2b(body).hexdigest()[:16]
+
+
+def create_app(
+    api_key: Optional[str] = None,
+    cache_ttl: float = 0.0,
+    stale_ttl: float = 0.0,
+    error_backoff: float = 0.0,
+) -> Flask:
     """Create and configure Flask application.
 
     Args:
         api_key: Optional API key to configure the app with
+        cache_ttl: Seconds to cache the rendered metrics body (0 disables caching)
+        stale_ttl: Seconds the last good response may be served when the
+            API fails (0 disables stale fallback)
+        error_backoff: Seconds to skip API calls after a failed scrape
+            (0 disables backoff)
 
     Returns:
         Configured Flask application
     """
     app = Flask(__name__)
 
+    # Fall back to the environment so WSGI servers that import the app
+    # factory directly (e.g. gunicorn) pick up the key without flags
+    api_key = api_key or os.environ.get(_API_KEY_ENV)
     if api_key:
         app.config["UPTIMEROBOT_API_KEY"] = api_key
 
+    # Response cache shared by all scrapers of this app. The lock doubles as
+    # single-flight protection: concurrent scrapes on a cold cache wait for
+    # the first one instead of each hitting the UptimeRobot API.
+    cache: Dict[str, Any] = {
+        "body": None,
+        "etag": None,
+        "expires": 0.0,
+        "last_good_body": None,
+        "last_good_time": 0.0,
+        "backoff_until": 0.0,
+        "scrape_errors": 0,
+        "collector": None,
+        "gz": (None, None),
+    }
+    cache_lock = threading.Lock()
+
+    # Static header set for metrics responses; copying it is cheaper
+    # than having Werkzeug re-derive the content type per scrape
+    metrics_headers = Headers(
+        [("Content-Type", f"{MIMETYPE_TEXT_PLAIN}; charset=utf-8")]
+    )
+
+    def _accepts_gzip() -> bool:
+        """Check whether the scraper advertises gzip support."""
+        return "gzip" in request.headers.get("Accept-Encoding", "")
+
+    def _gzip_body(body: bytes, etag: str) -> bytes:
+        """Compress a metrics body, reusing the cached form per ETag.
+
+        The (etag, body) pair is kept in one cache slot so readers
+        outside the lock never see an ETag paired with another body.
+        """
+        gz_etag, body_gz = cache["gz"]
+        if gz_etag == etag:
+            return body_gz
+        # Level 1 is plenty: exposition text is highly repetitive and
+        # higher levels cost CPU for marginal extra ratio
+        body_gz = gzip.compress(body, compresslevel=1)
+        cache["gz"] = (etag, body_gz)
+        return body_gz
+
+    def _metrics_response(body: bytes, etag: str) -> Response:
+        """Build a metrics response, honoring If-None-Match and gzip."""
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            headers = metrics_headers.copy()
+            if _accepts_gzip():
+                body = _gzip_body(body, etag)
+                headers["Content-Encoding"] = "gzip"
+                headers["Vary"] = "Accept-Encoding"
+            response = Response(body, headers=headers)
+        response.set_etag(etag)
+        return response
+
+    def _stale_response() -> Optional[Response]:
+        """Return the last good exposition if it is still fresh enough."""
+        if (
+            stale_ttl > 0
+            and cache["last_good_body"] is not None
+            and time.monotonic() - cache["last_good_time"] < stale_ttl
+        ):
+            return Response(
+                cache["last_good_body"],
+                mimetype=MIMETYPE_TEXT_PLAIN,
+                # Warning 110 is the standard "response is stale" signal
+                headers={"X-Cache": "STALE", "Warning": '110 - "Response is Stale"'},
+            )
+        return None
+
+    # Error handling lives in Flask's dispatcher rather than a
+    # try/except executed on every successful scrape.
+    app.config["PROPAGATE_EXCEPTIONS"] = False
+
+    @app.errorhandler(UptimeRobotAPIError)
+    def handle_api_error(e: UptimeRobotAPIError) -> Response:
+        """Serve stale metrics or a 503 when the UptimeRobot API fails."""
+        logger.error(f"UptimeRobot API error: {e}")
+        cache["scrape_errors"] += 1
+        if error_backoff > 0:
+            cache["backoff_until"] = time.monotonic() + error_backoff
+        stale = _stale_response()
+        if stale is not None:
+            return stale
+        return Response(
+            f"# UptimeRobot API Error: {e}\n",
+            mimetype=MIMETYPE_TEXT_PLAIN,
+            status=503,
+        )
+
+    @app.errorhandler(Exception)
+    def handle_unexpected_error(e: Exception) -> Any:
+        """Turn unexpected errors into a plain-text 500 with traceback."""
+        if isinstance(e, HTTPException):
+            # Routing errors such as 404 keep their normal responses
+            return e
+        logger.error(f"Error collecting metrics: {e}")
+        trace = traceback.format_exc()
+        return Response(
+            f"# Error collecting metrics\n{trace}",
+            mimetype=MIMETYPE_TEXT_PLAIN,
+            status=500,
+        )
+
     @app.route("/metrics")
     def metrics() -> Response:
         """Endpoint to serve Prometheus metrics.
@@ -299,38 +927,90 @@ def create_app(api_key: Optional[str] = None) -> Flask:
         Returns:
             Response with metrics in Prometheus format or error message
         """
-        try:
-            configured_api_key = app.config.get("UPTIMEROBOT_API_KEY")
-            if not configured_api_key:
-                return Response(
-                    "# Error: UptimeRobot API key not configured\n",
-                    mimetype=MIMETYPE_TEXT_PLAIN,
-                    status=500,
-                )
-
-            collector = UptimeRobotCollector.configure(configured_api_key)
-
-            registry = CollectorRegistry(auto_describe=True)
-            registry.register(collector)
-            data = generate_latest(registry)
+        configured_api_key = app.config.get("UPTIMEROBOT_API_KEY")
+        if not configured_api_key:
+            return Response(
+                "# Error: UptimeRobot API key not configured\n",
+                mimetype=MIMETYPE_TEXT_PLAIN,
+                status=500,
+            )
 
-            return Response(data, mimetype=MIMETYPE_TEXT_PLAIN)
+        if cache["body"] is not None and time.monotonic() < cache["expires"]:
+            return _metrics_response(cache["body"], cache["etag"])
 
-        except UptimeRobotAPIError as e:
-            logger.error(f"UptimeRobot API error: {e}")
+        if time.monotonic() < cache["backoff_until"]:
+            # Negative cache: a recent scrape failed, do not hammer
+            # the API again yet.
+            stale = _stale_response()
+            if stale is not None:
+                return stale
             return Response(
-                f"# UptimeRobot API Error: {e}\n",
+                "# UptimeRobot API Error: backing off after recent failure\n",
                 mimetype=MIMETYPE_TEXT_PLAIN,
                 status=503,
             )
-        except Exception as e:
-            logger.error(f"Error collecting metrics: {e}")
-            trace = traceback.format_exc()
-            return Response(
-                f"# Error collecting metrics\n{trace}",
-                mimetype=MIMETYPE_TEXT_PLAIN,
-                status=500,
+
+        with cache_lock:
+            # Re-check: another scraper may have refreshed the cache
+            # while we waited for the lock.
+            if cache["body"] is not None and time.monotonic() < cache["expires"]:
+                return _metrics_response(cache["body"], cache["etag"])
+
+            # One collector per app: keeps the datetime cache and
+            # single-flight state warm across scrapes
+            collector = cache["collector"]
+            if collector is None:
+                collector = UptimeRobotCollector.configure(configured_api_key)
+                cache["collector"] = collector
+
+            registry = CollectorRegistry(auto_describe=True)
+            registry.register(collector)
+
+            # Collecting runs the API scrape, so force it here where
+            # the registered error handlers still apply; only rendering
+            # streams.
+            families = list(registry.collect())
+
+            errors_family = core.CounterMetricFamily(
+                f"{NAMESPACE}_scrape_errors",
+                "Number of failed UptimeRobot API scrapes",
             )
+            errors_family.add_metric([], cache["scrape_errors"])
+            families.append(errors_family)
+
+            if cache_ttl > 0 or stale_ttl > 0:
+                data = b"".join(_iter_exposition(families))
+                etag = _make_etag(data)
+                if cache_ttl > 0:
+                    cache["body"] = data
+                    cache["etag"] = etag
+                    cache["expires"] = time.monotonic() + cache_ttl
+                if stale_ttl > 0:
+                    cache["last_good_body"] = data
+                    cache["last_good_time"] = time.monotonic()
+            else:
+                # Materialize while the lock is held: the gauges behind
+                # `families` are shared collector state that the next
+                # scrape resets, so rendering lazily after the lock is
+                # released would read mutated samples.
+                data = b"".join(_iter_exposition(families))
+                if _accepts_gzip():
+                    body_gz = gzip.compress(data, compresslevel=1)
+                    headers = metrics_headers.copy()
+                    headers["Content-Encoding"] = "gzip"
+                    headers["Vary"] = "Accept-Encoding"
+                    return Response(body_gz, headers=headers)
+                return Response(data, headers=metrics_headers.copy())
+
+        return _metrics_response(data, etag)
+
+    # Liveness probes hit /health every few seconds; one immutable
+    # response serves them all without per-request construction.
+    health_response = Response(
+        b"OK\n",
+        mimetype=MIMETYPE_TEXT_PLAIN,
+        headers={"Cache-Control": "no-store"},
+    )
 
     @app.route("/health")
     def health() -> Response:
@@ -339,7 +1019,7 @@ def create_app(api_key: Optional[str] = None) -> Flask:
         Returns:
             Simple health check response
         """
-        return Response("OK\n", mimetype=MIMETYPE_TEXT_PLAIN)
+        return health_response
 
     return app
 
@@ -361,12 +1041,58 @@ def parse_arguments() -> argparse.Namespace:
         help=f"Bind port (default: {DEFAULT_PORT})",
     )
     parser.add_argument("--config", help="Path to the configuration file")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds to cache the metrics response, 0 disables caching "
+        f"(default: {DEFAULT_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--stale-ttl",
+        type=float,
+        default=DEFAULT_STALE_TTL,
+        help=f"Seconds the last good response may be served while the API "
+        f"fails, 0 disables stale fallback (default: {DEFAULT_STALE_TTL})",
+    )
+    parser.add_argument(
+        "--error-backoff",
+        type=float,
+        default=0.0,
+        help="Seconds to skip API calls after a failed scrape, 0 disables "
+        "backoff (default: 0)",
+    )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Serve with Flask's development server instead of waitress",
+    )
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime: float) -> ConfigParser:
+    """Parse a configuration file, memoized on (path, mtime).
+
+    Args:
+        path: Expanded path to the configuration file
+        mtime: Modification time of the file, part of the cache key so
+            edited files are re-parsed
+
+    Returns:
+        Parsed ConfigParser instance
+    """
+    config = ConfigParser()
+    config.read(path)
+    return config
+
+
 def load_config(config_path: str) -> Optional[ConfigParser]:
     """Load configuration from file.
 
+    Unchanged files are served from a parse cache; callers treat the
+    returned parser as read-only.
+
     Args:
         config_path: Path to the configuration file
 
@@ -374,14 +1100,43 @@ def load_config(config_path: str) -> Optional[ConfigParser]:
         ConfigParser instance or None if loading fails
     """
     try:
-        config = ConfigParser()
-        config.read(os.path.expanduser(config_path))
-        return config
+        expanded = os.path.expanduser(config_path)
+        try:
+            mtime = os.path.getmtime(expanded)
+        except OSError:
+            # Missing or unreadable file: keep ConfigParser's lenient
+            # behavior (an empty parser) without polluting the cache
+            config = ConfigParser()
+            config.read(expanded)
+            return config
+        return _load_config_cached(expanded, mtime)
     except Exception as e:
         logger.error(f"Failed to read configuration file: {e}")
         return None
 
 
+# Matches the one key startup actually needs, without a full INI parse
+_FAST_APIKEY_RE = re.compile(r"(?m)^\s*api_key\s*=\s*(\S.*?)\s*$")
+
+
+def _read_api_key_fast(config_path: str) -> Optional[str]:
+    """Scan a config file for api_key without building a ConfigParser.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        API key string, or None if the file or key is missing so the
+        caller can fall back to the full parser
+    """
+    try:
+        with open(os.path.expanduser(config_path)) as config_file:
+            match = _FAST_APIKEY_RE.search(config_file.read())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
 def get_api_key(config: Optional[ConfigParser]) -> Optional[str]:
     """Get API key from environment or config file.
 
@@ -392,16 +1147,18 @@ def get_api_key(config: Optional[ConfigParser]) -> Optional[str]:
         API key string or None if not found
     """
     # Try environment variable first
-    api_key = os.environ.get("UPTIMEROBOT_API_KEY")
+    api_key = os.environ.get(_API_KEY_ENV)
     if api_key:
         return api_key
 
-    # Try config file
-    if config:
-        try:
-            return config.get("default", "api_key")
-        except Exception as e:
-            logger.warning(f"Failed to get api_key from config: {e}")
+    # Try config file; membership checks are cheaper than catching
+    # NoSectionError/NoOptionError and this runs once per worker startup
+    if (
+        config is not None
+        and config.has_section("default")
+        and config.has_option("default", "api_key")
+    ):
+        return config.get("default", "api_key")
 
     return None
 
@@ -422,22 +1179,46 @@ def main() -> None:
     """Main entry point for the application."""
     options = parse_arguments()
 
-    # Load configuration if specified
-    config = None
-    if options.config:
-        config = load_config(options.config)
+    # Environment variable wins, so only read the configuration file
+    # when it actually has to be consulted
+    api_key = os.environ.get(_API_KEY_ENV)
+    if not api_key and options.config:
+        # Startup only needs this one key; try the regex scan before
+        # paying for a full ConfigParser parse
+        api_key = _read_api_key_fast(options.config)
+    if not api_key:
+        config = load_config(options.config) if options.config else None
+        api_key = get_api_key(config)
 
-    # Get API key
-    api_key = get_api_key(config)
     if not api_key:
         logger.error("UptimeRobot API key not found in environment or config file")
         return
 
     # Create and configure Flask app
-    app = create_app(api_key)
+    app = create_app(
+        api_key,
+        cache_ttl=options.cache_ttl,
+        stale_ttl=options.stale_ttl,
+        error_backoff=options.error_backoff,
+    )
 
     logger.info(f"Starting server on {options.host}:{options.port}")
-    app.run(host=options.host, port=options.port)
+    if options.dev:
+        app.run(host=options.host, port=options.port)
+        return
+
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        logger.warning(
+            "waitress is not installed, falling back to Flask's development server"
+        )
+        app.run(host=options.host, port=options.port)
+        return
+
+    # Threaded WSGI server: concurrent scrapes overlap their API I/O
+    # instead of queueing behind Flask's single-threaded dev server
+    waitress_serve(app, host=options.host, port=options.port, threads=SERVER_THREADS)
 
 
 if __name__ == "__main__":
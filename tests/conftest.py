@@ -1,14 +1,62 @@
 """Fixtures and utilities for tests."""
 
+import json
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from ws.prometheus_uptimerobot import web
 
 # Constants for test data
 TEST_SSL_EXPIRY_DATE = "2025-12-31T23:59:59.000Z"
 
 
+class StubAdapter(HTTPAdapter):
+    """Transport adapter that serves canned payloads by URL.
+
+    Unlike `responses`, no request matching or mock bookkeeping happens
+    per call, which keeps HTTP-heavy tests fast.
+    """
+
+    def __init__(self, payloads: Dict[str, bytes]) -> None:
+        super().__init__()
+        self._payloads = payloads
+
+    def send(self, request: Any, **kwargs: Any) -> requests.Response:
+        """Return the canned response for the requested URL."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = self._payloads[request.url]
+        return response
+
+
+@pytest.fixture
+def stub_transport() -> Callable[[Dict[str, Any]], None]:
+    """Install canned API payloads on the shared HTTP session.
+
+    Yields a function taking a URL -> JSON payload mapping; the
+    session's real adapters are restored after the test.
+    """
+    saved_adapters = web._SESSION.adapters.copy()
+
+    def install(payloads: Dict[str, Any]) -> None:
+        encoded = {
+            url: json.dumps(payload).encode() for url, payload in payloads.items()
+        }
+        adapter = StubAdapter(encoded)
+        web._SESSION.mount("https://", adapter)
+        web._SESSION.mount("http://", adapter)
+
+    yield install
+
+    web._SESSION.adapters = saved_adapters
+
+
 @pytest.fixture
 def sample_monitor_data() -> Dict[str, Any]:
     """Sample monitor data from UptimeRobot API."""
@@ -60,26 +108,34 @@ def sample_paginated_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_api_key() -> str:
     """Test API key."""
     return "ur12345-abcdef123456789"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_datetime_string() -> str:
     """Invalid datetime string for testing."""
     return "invalid-datetime"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_datetime_string() -> str:
     """Valid datetime string for testing."""
     return TEST_SSL_EXPIRY_DATE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expected_timestamp() -> float:
     """Expected timestamp from valid datetime string."""
     dt = datetime.fromisoformat("2025-12-31T23:59:59.000+00:00")
     return dt.timestamp()
+
+
+@pytest.fixture
+def configured_app(test_api_key):
+    """Flask app configured with the test API key."""
+    app = web.create_app(test_api_key)
+    app.config["TESTING"] = True
+    return app
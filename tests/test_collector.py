@@ -108,6 +108,21 @@ class TestUptimeRobotCollector:
         result = UptimeRobotCollector._parse_iso_datetime(invalid_datetime_string)
         assert result is None
 
+    def test_parse_iso_datetime_offset_format(self, expected_timestamp):
+        """Test that explicit-offset strings match the API's Z format."""
+        result = UptimeRobotCollector._parse_iso_datetime("2025-12-31T23:59:59+00:00")
+        assert result == expected_timestamp
+
+    def test_parse_iso_datetime_out_of_range_seconds(self):
+        """Test that out-of-range seconds are rejected, not wrapped."""
+        result = UptimeRobotCollector._parse_iso_datetime("2025-06-15T12:30:99.000Z")
+        assert result is None
+
+    def test_parse_iso_datetime_impossible_calendar_date(self):
+        """Test that impossible dates are rejected, not normalized."""
+        result = UptimeRobotCollector._parse_iso_datetime("2025-02-30T12:00:00.000Z")
+        assert result is None
+
     @responses.activate
     def test_get_paginated_success(self, test_api_key, sample_api_response):
         """Test successful API request."""
@@ -149,6 +164,39 @@ class TestUptimeRobotCollector:
         with pytest.raises(UptimeRobotAPIError, match="API request failed"):
             collector._get_paginated()
 
+        # Client errors such as bad credentials must not be retried
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_paginated_retries_server_errors(self, test_api_key):
+        """Test that transient 5xx responses are retried before failing."""
+        responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=503)
+
+        collector = UptimeRobotCollector(test_api_key)
+
+        with pytest.raises(UptimeRobotAPIError, match="API request failed"):
+            collector._get_paginated()
+
+        # Initial attempt plus three retries from the adapter's policy
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_circuit_breaker_opens_after_failures(self, test_api_key):
+        """Test that repeated failures short-circuit further API calls."""
+        responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=503)
+
+        collector = UptimeRobotCollector(test_api_key)
+        for _ in range(collector._breaker.failure_threshold):
+            with pytest.raises(UptimeRobotAPIError, match="API request failed"):
+                collector._get_paginated()
+
+        calls_before_open = len(responses.calls)
+        with pytest.raises(UptimeRobotAPIError, match="circuit open"):
+            collector._get_paginated()
+
+        # The open breaker must not reach the network at all
+        assert len(responses.calls) == calls_before_open
+
     @responses.activate
     def test_get_paginated_connection_error(self, test_api_key):
         """Test API request with connection error."""
@@ -163,15 +211,11 @@ class TestUptimeRobotCollector:
         with pytest.raises(UptimeRobotAPIError, match="API request failed"):
             collector._get_paginated()
 
-    @responses.activate
-    def test_get_monitors_single_page(self, test_api_key, sample_api_response):
+    def test_get_monitors_single_page(
+        self, test_api_key, sample_api_response, stub_transport
+    ):
         """Test getting monitors from single page."""
-        responses.add(
-            responses.GET,
-            f"{API_BASE_URL}/monitors/",
-            json=sample_api_response,
-            status=200,
-        )
+        stub_transport({f"{API_BASE_URL}/monitors/": sample_api_response})
 
         collector = UptimeRobotCollector(test_api_key)
         monitors = collector._get_monitors()
@@ -180,18 +224,10 @@ class TestUptimeRobotCollector:
         assert monitors[0]["friendlyName"] == "Test Monitor 1"
         assert monitors[1]["friendlyName"] == "Test Monitor 2"
 
-    @responses.activate
-    def test_get_monitors_multiple_pages(self, test_api_key, sample_paginated_response):
+    def test_get_monitors_multiple_pages(
+        self, test_api_key, sample_paginated_response, stub_transport
+    ):
         """Test getting monitors from multiple pages."""
-        # First page
-        responses.add(
-            responses.GET,
-            f"{API_BASE_URL}/monitors/",
-            json=sample_paginated_response,
-            status=200,
-        )
-
-        # Second page
         second_page_response = {
             "data": [
                 {
@@ -202,11 +238,11 @@ class TestUptimeRobotCollector:
                 }
             ]
         }
-        responses.add(
-            responses.GET,
-            "https://api.uptimerobot.com/v3/monitors/?page=2",
-            json=second_page_response,
-            status=200,
+        stub_transport(
+            {
+                f"{API_BASE_URL}/monitors/": sample_paginated_response,
+                "https://api.uptimerobot.com/v3/monitors/?page=2": second_page_response,
+            }
         )
 
         collector = UptimeRobotCollector(test_api_key)
@@ -217,12 +253,112 @@ class TestUptimeRobotCollector:
         assert monitors[1]["friendlyName"] == "Test Monitor Page 2"
 
     @responses.activate
-    def test_get_monitors_empty_response(self, test_api_key):
-        """Test getting monitors with empty response."""
+    def test_get_monitors_parallel_pages(self, test_api_key):
+        """Test that a known total count fetches remaining pages concurrently."""
+        first_page = {
+            "data": [
+                {"friendlyName": f"Monitor {i}", "status": "UP"} for i in range(2)
+            ],
+            "total": 6,
+            "nextLink": f"{API_BASE_URL}/monitors/?page=2",
+        }
+        responses.add(
+            responses.GET, f"{API_BASE_URL}/monitors/", json=first_page, status=200
+        )
+        for page in (2, 3):
+            responses.add(
+                responses.GET,
+                f"{API_BASE_URL}/monitors/?page={page}",
+                json={
+                    "data": [
+                        {"friendlyName": f"Monitor {page}-{i}", "status": "UP"}
+                        for i in range(2)
+                    ]
+                },
+                status=200,
+            )
+
+        collector = UptimeRobotCollector(test_api_key)
+        monitors = collector._get_monitors()
+
+        assert len(monitors) == 6
+        assert len(responses.calls) == 3
+
+    def test_remaining_page_urls_without_total(self, sample_paginated_response):
+        """Test that responses without a total count fall back to nextLink."""
+        urls = UptimeRobotCollector._remaining_page_urls(sample_paginated_response)
+        assert urls == []
+
+    def test_remaining_page_urls_with_total(self):
+        """Test page URL derivation from total count and page size."""
+        response = {
+            "data": [{}, {}],
+            "total": 5,
+            "nextLink": f"{API_BASE_URL}/monitors/?page=2",
+        }
+        urls = UptimeRobotCollector._remaining_page_urls(response)
+        assert urls == [
+            f"{API_BASE_URL}/monitors/?page=2",
+            f"{API_BASE_URL}/monitors/?page=3",
+        ]
+
+    def test_remaining_page_urls_keeps_other_query_params(self):
+        """Test that rewriting the page number preserves other parameters."""
+        response = {
+            "data": [{}, {}],
+            "total": 5,
+            "nextLink": f"{API_BASE_URL}/monitors/?page=2&limit=2",
+        }
+        urls = UptimeRobotCollector._remaining_page_urls(response)
+        assert urls == [
+            f"{API_BASE_URL}/monitors/?page=2&limit=2",
+            f"{API_BASE_URL}/monitors/?page=3&limit=2",
+        ]
+
+    @responses.activate
+    def test_get_monitors_single_flight(self, test_api_key, sample_api_response):
+        """Test that concurrent fetches share one upstream request."""
+        import json
+        import time as time_module
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_api(request):
+            time_module.sleep(0.2)
+            return (200, {}, json.dumps(sample_api_response))
+
+        responses.add_callback(
+            responses.GET, f"{API_BASE_URL}/monitors/", callback=slow_api
+        )
+
+        collector = UptimeRobotCollector(test_api_key)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(collector._get_monitors)
+            second = executor.submit(collector._get_monitors)
+            assert first.result() == second.result()
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_monitors_cached_within_ttl(self, test_api_key, sample_api_response):
+        """Test that a positive cache_ttl reuses fetched monitors."""
         responses.add(
-            responses.GET, f"{API_BASE_URL}/monitors/", json={"data": []}, status=200
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
         )
 
+        collector = UptimeRobotCollector(test_api_key, cache_ttl=60.0)
+        first = collector._get_monitors()
+        second = collector._get_monitors()
+
+        assert first == second
+        assert len(responses.calls) == 1
+
+    def test_get_monitors_empty_response(self, test_api_key, stub_transport):
+        """Test getting monitors with empty response."""
+        stub_transport({f"{API_BASE_URL}/monitors/": {"data": []}})
+
         collector = UptimeRobotCollector(test_api_key)
         monitors = collector._get_monitors()
 
@@ -281,6 +417,46 @@ class TestUptimeRobotCollector:
         labels = metrics["up"].samples[0].labels
         assert labels["monitor_paused"] == "true"
 
+    def test_process_monitors_parallel_sharding(self, test_api_key):
+        """Test that large monitor lists are processed across shards."""
+        monitors = [
+            {
+                "friendlyName": f"Monitor {i}",
+                "type": "http",
+                "url": f"https://example{i}.com",
+                "status": "UP",
+            }
+            for i in range(250)
+        ]
+
+        collector = UptimeRobotCollector(test_api_key)
+        metrics = {key: value.clone() for key, value in collector.metrics.items()}
+
+        collector._process_monitors(monitors, metrics)
+
+        # All monitors are processed and sample order is preserved
+        assert len(metrics["up"].samples) == 250
+        assert metrics["up"].samples[0].labels["monitor_name"] == "Monitor 0"
+        assert metrics["up"].samples[-1].labels["monitor_name"] == "Monitor 249"
+
+    def test_process_monitor_unknown_status(self, test_api_key):
+        """Test processing monitor with an unknown status string."""
+        monitor_data = {
+            "friendlyName": "Unknown Monitor",
+            "type": "http",
+            "url": "https://unknown.com",
+            "status": "NOT CHECKED YET",
+        }
+
+        collector = UptimeRobotCollector(test_api_key)
+        metrics = {key: value.clone() for key, value in collector.metrics.items()}
+
+        collector._process_monitor(monitor_data, metrics)
+
+        # Unknown statuses are treated as down and not paused
+        assert metrics["up"].samples[0].value == 0
+        assert metrics["up"].samples[0].labels["monitor_paused"] == "false"
+
     def test_process_monitor_missing_fields(self, test_api_key):
         """Test processing monitor with missing fields."""
         monitor_data = {}
@@ -342,6 +518,31 @@ class TestUptimeRobotCollector:
         assert len(scrape_duration_metric.samples) == 1
         assert scrape_duration_metric.samples[0].value >= 0
 
+    @responses.activate
+    def test_collect_resets_samples_between_scrapes(
+        self, test_api_key, sample_api_response
+    ):
+        """Test that repeated collects do not accumulate samples."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        collector = UptimeRobotCollector(test_api_key)
+        collector.collect()
+        metrics = collector.collect()
+
+        up_metric = next(m for m in metrics if m.name.endswith("_up"))
+        assert len(up_metric.samples) == 2  # one per monitor, not per scrape
+
     @responses.activate
     def test_collect_api_error(self, test_api_key):
         """Test metric collection with API error."""
@@ -8,6 +8,7 @@ from unittest.mock import patch
 from ws.prometheus_uptimerobot.web import (
     DEFAULT_HOST,
     DEFAULT_PORT,
+    _read_api_key_fast,
     get_api_key,
     load_config,
     parse_arguments,
@@ -52,6 +53,16 @@ class TestConfiguration:
             assert args.port == 9999
             assert isinstance(args.port, int)
 
+    def test_parse_arguments_cache_ttl(self):
+        """Test cache TTL argument parsing."""
+        with patch("sys.argv", ["script.py"]):
+            args = parse_arguments()
+            assert args.cache_ttl == 15.0
+
+        with patch("sys.argv", ["script.py", "--cache-ttl", "0"]):
+            args = parse_arguments()
+            assert args.cache_ttl == 0.0
+
     def test_load_config_success(self):
         """Test successful config loading."""
         config_content = """
@@ -89,6 +100,24 @@ api_key = ur12345-test-key
                 mock_expand.assert_called_once_with("~/config.ini")
                 mock_read.assert_called_once_with("/home/user/config.ini")
 
+    def test_load_config_caches_unchanged_file(self):
+        """Test that re-loading an unchanged file reuses the parsed config."""
+        config_content = """
+[default]
+api_key = ur12345-cached-key
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
+            f.write(config_content)
+            f.flush()
+
+            try:
+                first = load_config(f.name)
+                second = load_config(f.name)
+                assert first is second
+            finally:
+                os.unlink(f.name)
+
     @patch("ws.prometheus_uptimerobot.web.logger")
     def test_load_config_with_exception(self, mock_logger):
         """Test config loading with exception."""
@@ -99,6 +128,26 @@ api_key = ur12345-test-key
             assert config is None
             mock_logger.error.assert_called_once()
 
+    def test_read_api_key_fast(self):
+        """Test the regex fast path for reading api_key from a file."""
+        config_content = """
+[default]
+api_key = ur12345-fast-key
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
+            f.write(config_content)
+            f.flush()
+
+            try:
+                assert _read_api_key_fast(f.name) == "ur12345-fast-key"
+            finally:
+                os.unlink(f.name)
+
+    def test_read_api_key_fast_missing_file(self):
+        """Test that the fast path signals a fallback for missing files."""
+        assert _read_api_key_fast("/non/existent/file.ini") is None
+
     def test_get_api_key_from_environment(self):
         """Test getting API key from environment variable."""
         test_key = "ur12345-env-key"
@@ -195,19 +195,71 @@ class TestErrorHandling:
 
         with patch("ws.prometheus_uptimerobot.web.parse_arguments") as mock_parse:
             mock_parse.return_value = MagicMock(
-                config=None, host="localhost", port=9429
+                config=None,
+                host="localhost",
+                port=9429,
+                cache_ttl=15.0,
+                stale_ttl=300.0,
+                error_backoff=0.0,
+                dev=True,
             )
 
             with patch.dict("os.environ", {"UPTIMEROBOT_API_KEY": test_api_key}):
                 main()
 
                 # Should create app and run it
-                mock_create_app.assert_called_once_with(test_api_key)
+                mock_create_app.assert_called_once_with(
+                    test_api_key, cache_ttl=15.0, stale_ttl=300.0, error_backoff=0.0
+                )
                 mock_app.run.assert_called_once_with(host="localhost", port=9429)
 
                 # Should log startup message
                 mock_logger.info.assert_called_with("Starting server on localhost:9429")
 
+    @patch("waitress.serve")
+    @patch("ws.prometheus_uptimerobot.web.create_app")
+    def test_main_function_serves_with_waitress(
+        self, mock_create_app, mock_serve, test_api_key
+    ):
+        """Test that main serves through waitress outside dev mode."""
+        mock_app = MagicMock()
+        mock_create_app.return_value = mock_app
+
+        with patch("ws.prometheus_uptimerobot.web.parse_arguments") as mock_parse:
+            mock_parse.return_value = MagicMock(
+                config=None,
+                host="localhost",
+                port=9429,
+                cache_ttl=15.0,
+                stale_ttl=300.0,
+                error_backoff=0.0,
+                dev=False,
+            )
+
+            with patch.dict("os.environ", {"UPTIMEROBOT_API_KEY": test_api_key}):
+                main()
+
+                mock_serve.assert_called_once_with(
+                    mock_app, host="localhost", port=9429, threads=8
+                )
+                mock_app.run.assert_not_called()
+
+    @patch("ws.prometheus_uptimerobot.web.create_app")
+    @patch("ws.prometheus_uptimerobot.web.load_config")
+    def test_main_function_env_skips_config_read(
+        self, mock_load_config, mock_create_app, test_api_key
+    ):
+        """Test that main does not read the config file when env is set."""
+        with patch("ws.prometheus_uptimerobot.web.parse_arguments") as mock_parse:
+            mock_parse.return_value = MagicMock(
+                config="/some/config.ini", host="localhost", port=9429
+            )
+
+            with patch.dict("os.environ", {"UPTIMEROBOT_API_KEY": test_api_key}):
+                main()
+
+                mock_load_config.assert_not_called()
+
     def test_edge_case_empty_api_response(self, test_api_key):
         """Test handling of completely empty API response."""
         with responses.RequestsMock() as rsps:
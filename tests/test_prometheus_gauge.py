@@ -93,6 +93,18 @@ class TestPrometheusGauge:
         # Test cloning preserves the namespace
         assert cloned.name.startswith("custom_")
 
+    def test_reset_samples(self):
+        """Test resetting samples on a reused gauge."""
+        gauge = PrometheusGauge("test_metric", "Test documentation")
+        gauge(100, {"test": "value"})  # Add a sample
+
+        gauge.reset_samples()
+
+        # Name and documentation survive, samples are gone
+        assert gauge.name == "uptimerobot_test_metric"
+        assert gauge.documentation == "Test documentation"
+        assert len(gauge.samples) == 0
+
     def test_inheritance_from_gauge_metric_family(self):
         """Test that PrometheusGauge properly inherits from GaugeMetricFamily."""
         gauge = PrometheusGauge("test_metric", "Test documentation")
@@ -4,7 +4,12 @@ from unittest.mock import MagicMock, patch
 
 import responses
 
-from ws.prometheus_uptimerobot.web import API_BASE_URL, MIMETYPE_TEXT_PLAIN, create_app
+from ws.prometheus_uptimerobot.web import (
+    API_BASE_URL,
+    MIMETYPE_TEXT_PLAIN,
+    UptimeRobotCollector,
+    create_app,
+)
 
 
 class TestFlaskApp:
@@ -21,6 +26,12 @@ class TestFlaskApp:
         app = create_app(test_api_key)
         assert app.config["UPTIMEROBOT_API_KEY"] == test_api_key
 
+    def test_create_app_api_key_from_environment(self, test_api_key):
+        """Test that the app factory falls back to the environment."""
+        with patch.dict("os.environ", {"UPTIMEROBOT_API_KEY": test_api_key}):
+            app = create_app()
+        assert app.config["UPTIMEROBOT_API_KEY"] == test_api_key
+
     def test_health_endpoint(self):
         """Test health check endpoint."""
         app = create_app()
@@ -29,6 +40,7 @@ class TestFlaskApp:
             assert response.status_code == 200
             assert response.data == b"OK\n"
             assert response.mimetype == MIMETYPE_TEXT_PLAIN
+            assert response.headers["Cache-Control"] == "no-store"
 
     def test_metrics_endpoint_no_api_key(self):
         """Test metrics endpoint without API key."""
@@ -40,7 +52,7 @@ class TestFlaskApp:
             assert response.mimetype == MIMETYPE_TEXT_PLAIN
 
     @responses.activate
-    def test_metrics_endpoint_success(self, test_api_key, sample_api_response):
+    def test_metrics_endpoint_success(self, configured_app, sample_api_response):
         """Test successful metrics endpoint."""
         responses.add(
             responses.GET,
@@ -49,8 +61,7 @@ class TestFlaskApp:
             status=200,
         )
 
-        app = create_app(test_api_key)
-        with app.test_client() as client:
+        with configured_app.test_client() as client:
             response = client.get("/metrics")
             assert response.status_code == 200
             assert response.mimetype == MIMETYPE_TEXT_PLAIN
@@ -62,12 +73,11 @@ class TestFlaskApp:
             assert "uptimerobot_scrape_duration_seconds" in response_text
 
     @responses.activate
-    def test_metrics_endpoint_api_error(self, test_api_key):
+    def test_metrics_endpoint_api_error(self, configured_app):
         """Test metrics endpoint with API error."""
         responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=401)
 
-        app = create_app(test_api_key)
-        with app.test_client() as client:
+        with configured_app.test_client() as client:
             response = client.get("/metrics")
             assert response.status_code == 503
             assert b"UptimeRobot API Error" in response.data
@@ -123,7 +133,7 @@ class TestFlaskApp:
 
     @responses.activate
     def test_metrics_endpoint_multiple_monitors(
-        self, test_api_key, sample_api_response
+        self, configured_app, sample_api_response
     ):
         """Test metrics endpoint with multiple monitors."""
         responses.add(
@@ -133,8 +143,7 @@ class TestFlaskApp:
             status=200,
         )
 
-        app = create_app(test_api_key)
-        with app.test_client() as client:
+        with configured_app.test_client() as client:
             response = client.get("/metrics")
             assert response.status_code == 200
 
@@ -143,6 +152,177 @@ class TestFlaskApp:
             assert 'monitor_name="Test Monitor 1"' in response_text
             assert 'monitor_name="Test Monitor 2"' in response_text
 
+    @responses.activate
+    def test_metrics_endpoint_reuses_collector(self, test_api_key, sample_api_response):
+        """Test that scrapes share one collector instance per app."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key)
+        with app.test_client() as client:
+            with patch(
+                "ws.prometheus_uptimerobot.web.UptimeRobotCollector.configure",
+                wraps=UptimeRobotCollector.configure,
+            ) as mock_configure:
+                assert client.get("/metrics").status_code == 200
+                assert client.get("/metrics").status_code == 200
+                mock_configure.assert_called_once()
+
+    @responses.activate
+    def test_metrics_endpoint_cached_within_ttl(
+        self, test_api_key, sample_api_response
+    ):
+        """Test that a fresh cache serves scrapes without hitting the API."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key, cache_ttl=60.0)
+        with app.test_client() as client:
+            first = client.get("/metrics")
+            second = client.get("/metrics")
+
+            assert first.status_code == 200
+            assert second.status_code == 200
+            assert second.data == first.data
+            # Only the first scrape should reach the API
+            assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_metrics_endpoint_cache_disabled_by_default(
+        self, test_api_key, sample_api_response
+    ):
+        """Test that caching is off unless a TTL is configured."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key)
+        with app.test_client() as client:
+            client.get("/metrics")
+            client.get("/metrics")
+            assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_metrics_endpoint_gzip(self, test_api_key, sample_api_response):
+        """Test gzip-compressed metrics for scrapers that accept it."""
+        import gzip
+
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key, cache_ttl=60.0)
+        with app.test_client() as client:
+            response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert response.headers["Vary"] == "Accept-Encoding"
+            assert b"uptimerobot_up" in gzip.decompress(response.data)
+
+            # Plain clients still get the identity body
+            plain = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+            assert "Content-Encoding" not in plain.headers
+            assert b"uptimerobot_up" in plain.data
+
+    @responses.activate
+    def test_metrics_endpoint_etag_and_304(self, test_api_key, sample_api_response):
+        """Test ETag emission and If-None-Match handling."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key, cache_ttl=60.0)
+        with app.test_client() as client:
+            response = client.get("/metrics")
+            etag = response.headers.get("ETag")
+            assert etag
+
+            cached = client.get("/metrics", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.data == b""
+
+    @responses.activate
+    def test_metrics_endpoint_stale_fallback(self, test_api_key, sample_api_response):
+        """Test that the last good response is served when the API fails."""
+        responses.add(
+            responses.GET,
+            f"{API_BASE_URL}/monitors/",
+            json=sample_api_response,
+            status=200,
+        )
+
+        app = create_app(test_api_key, stale_ttl=300.0)
+        with app.test_client() as client:
+            good = client.get("/metrics")
+            assert good.status_code == 200
+
+            responses.reset()
+            responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=500)
+
+            stale = client.get("/metrics")
+            assert stale.status_code == 200
+            assert stale.headers.get("X-Cache") == "STALE"
+            assert stale.headers.get("Warning", "").startswith("110 ")
+            assert b"uptimerobot_up" in stale.data
+
+    @responses.activate
+    def test_metrics_endpoint_scrape_errors_counter(
+        self, test_api_key, sample_api_response
+    ):
+        """Test that failed scrapes are counted in the exposition."""
+        responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=500)
+
+        app = create_app(test_api_key)
+        with app.test_client() as client:
+            assert client.get("/metrics").status_code == 503
+
+            responses.reset()
+            responses.add(
+                responses.GET,
+                f"{API_BASE_URL}/monitors/",
+                json=sample_api_response,
+                status=200,
+            )
+
+            response = client.get("/metrics")
+            assert response.status_code == 200
+            assert b"uptimerobot_scrape_errors_total 1.0" in response.data
+
+    @responses.activate
+    def test_metrics_endpoint_error_backoff(self, test_api_key):
+        """Test that a failed scrape suppresses API calls during backoff."""
+        responses.add(responses.GET, f"{API_BASE_URL}/monitors/", status=500)
+
+        app = create_app(test_api_key, error_backoff=60.0)
+        with app.test_client() as client:
+            first = client.get("/metrics")
+            assert first.status_code == 503
+            calls_after_first = len(responses.calls)
+
+            second = client.get("/metrics")
+            assert second.status_code == 503
+            assert b"backing off" in second.data
+            # The second scrape must not reach the API
+            assert len(responses.calls) == calls_after_first
+
     def test_app_routes_exist(self):
         """Test that required routes exist."""
         app = create_app()